@@ -28,8 +28,10 @@ except ImportError:
 
 
 def load_config(config_path: str) -> dict:
-	"""Load configuration from a JSON file."""
+	"""Load configuration from a JSON file, or from stdin when the path is '-'."""
 	try:
+		if config_path == "-":
+			return json.load(sys.stdin)
 		with open(config_path, 'r', encoding='utf-8') as f:
 			return json.load(f)
 	except (FileNotFoundError, json.JSONDecodeError) as e:
@@ -300,7 +302,7 @@ def main():
 	parser.add_argument(
 		"--config",
 		default="rule_config.json",
-		help="Path to configuration JSON file",
+		help="Path to configuration JSON file (use '-' to read it from stdin)",
 	)
 	parser.add_argument(
 		"--files",
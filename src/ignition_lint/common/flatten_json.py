@@ -18,23 +18,26 @@ UNICODE_REPLACEMENTS = {
 }
 UNICODE_RESTORE = {v: k for k, v in UNICODE_REPLACEMENTS.items()}
 
+# Single-pass lookups: the escapes as they appear in the text, mapped both ways
+_ESCAPE_TO_PLACEHOLDER = {
+	escape.replace('\\\\', '\\'): placeholder for escape, placeholder in UNICODE_REPLACEMENTS.items()
+}
+_PLACEHOLDER_TO_ESCAPE = {placeholder: escape for escape, placeholder in _ESCAPE_TO_PLACEHOLDER.items()}
+_ESCAPE_RE = re.compile('|'.join(UNICODE_REPLACEMENTS))
+_PLACEHOLDER_RE = re.compile('|'.join(map(re.escape, UNICODE_RESTORE)))
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 LOGGER = logging.getLogger(__name__)
 
 
 def preserve_unicode_escapes(text):
 	"""Preserve specific Unicode escapes in JSON content."""
-	for escape, placeholder in UNICODE_REPLACEMENTS.items():
-		text = re.sub(escape, placeholder, text)
-	return text
+	return _ESCAPE_RE.sub(lambda match: _ESCAPE_TO_PLACEHOLDER[match.group()], text)
 
 
 def restore_unicode_escapes(text):
 	"""Restore Unicode escapes from placeholders."""
-	for placeholder, escape in UNICODE_RESTORE.items():
-		# We need to use a raw string for the replacement to handle backslashes properly
-		text = text.replace(placeholder, escape.replace('\\\\', '\\'))
-	return text
+	return _PLACEHOLDER_RE.sub(lambda match: _PLACEHOLDER_TO_ESCAPE[match.group()], text)
 
 
 def format_json(obj):
@@ -167,37 +170,32 @@ def _extract_java_date_timestamp(data):
 	return data["$ts"]
 
 
-def _process_dict_item(key, value, path, results):
-	"""Process a single key-value pair from a dictionary."""
-	current_path = f"{path}.{key}" if path else key
-	if isinstance(value, dict):
-		# Check if this is a Java Date object
-		if _is_java_date_object(value):
-			# Store as a single encoded date value
-			timestamp = _extract_java_date_timestamp(value)
-			results[f"{current_path}._JavaDate"] = timestamp
-		else:
-			# Regular dictionary - flatten recursively
-			flatten_json(value, current_path, results)
-	elif isinstance(value, list):
-		_process_list_items(value, current_path, results)
-	else:
-		results[current_path] = value
-
-
-def _process_list_items(items, base_path, results):
-	"""Process all items in a list."""
-	for index, item in enumerate(items):
-		item_path = f"{base_path}[{index}]"
-		_process_single_item(item, item_path, results)
-
-
-def _process_single_item(item, item_path, results):
-	"""Process a single item, whether primitive or complex."""
-	if isinstance(item, (dict, list)):
-		flatten_json(item, item_path, results)
+def _flatten_into(data, path, results):
+	"""Add the path-to-value pairs of a dict or list to results, recursing into nested containers."""
+	if isinstance(data, dict):
+		path = _get_component_path(data, path)
+		prefix = f"{path}." if path else ""
+		for key, value in data.items():
+			current_path = f"{prefix}{key}"
+			# Empty containers add nothing, so they are not descended into
+			if isinstance(value, dict):
+				# Java Date objects are stored as a single encoded date value
+				if "$ts" in value and _is_java_date_object(value):
+					results[f"{current_path}._JavaDate"] = _extract_java_date_timestamp(value)
+				elif value:
+					_flatten_into(value, current_path, results)
+			elif isinstance(value, list):
+				if value:
+					_flatten_into(value, current_path, results)
+			else:
+				results[current_path] = value
 	else:
-		results[item_path] = item
+		for index, item in enumerate(data):
+			if isinstance(item, (dict, list)):
+				if item:
+					_flatten_into(item, f"{path}[{index}]", results)
+			else:
+				results[f"{path}[{index}]"] = item
 
 
 def flatten_json(data, path="", results=None):
@@ -206,24 +204,17 @@ def flatten_json(data, path="", results=None):
 
 	Args:
 		data (dict): The JSON data to flatten.
-		path (str): The current path being traversed (used internally).
-		results (dict): The dictionary to store the results (used internally).
+		path (str): The path to prefix the flattened keys with.
+		results (dict): An existing dictionary to add the results to.
 
 	Returns:
-		dict: A flattened dictionary where keys are paths and values are primitive values.
+		dict: A flattened dictionary where keys are paths and values are primitive values, in document order.
 	"""
 	if results is None:
-		results = OrderedDict()
+		results = {}
 
-	if isinstance(data, dict):
-		path = _get_component_path(data, path)
-		for key, value in data.items():
-			_process_dict_item(key, value, path, results)
-	elif isinstance(data, list):
-		base_path = path if path else ""
-		for index, item in enumerate(data):
-			item_path = f"{base_path}[{index}]" if base_path else f"[{index}]"
-			_process_single_item(item, item_path, results)
+	if isinstance(data, (dict, list)):
+		_flatten_into(data, path, results)
 
 	return results
 
@@ -37,11 +37,21 @@ class LintEngine:
 		"""Return the structured view model."""
 		return self.model_builder.build_model(self.flattened_json)
 
-	def process(self, flattened_json: Dict[str, Any], source_file_path: Optional[str] = None) -> LintResults:
-		"""Lint the given flattened JSON and return warnings and errors."""
+	def process(
+		self,
+		flattened_json: Dict[str, Any],
+		source_file_path: Optional[str] = None,
+		view_model: Optional[Dict[str, List[Any]]] = None
+	) -> LintResults:
+		"""
+		Lint the given flattened JSON and return warnings and errors.
+
+		A view model already built from the same flattened JSON can be passed in to skip rebuilding it;
+		rules only read the nodes, so one model can be shared by several lint passes.
+		"""
 		# Build the object model
 		self.flattened_json = flattened_json
-		self.view_model = self.get_view_model()
+		self.view_model = view_model if view_model is not None else self.get_view_model()
 
 		# Save debug information if debug output directory is configured
 		if self.debug_output_dir and source_file_path:
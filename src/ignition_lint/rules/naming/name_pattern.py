@@ -1,6 +1,7 @@
 """
 Fixed NamePatternRule that properly handles node-specific pattern configurations.
 """
+import functools
 import re
 from typing import Dict, Optional, Set, Callable, Any
 from dataclasses import dataclass
@@ -8,6 +9,38 @@ from ..common import LintingRule
 from ...model.node_types import ViewNode, NodeType
 
 
+# Node-specific name list options, stored as sets so membership checks don't scan a list
+_NAME_SET_KEYS = ('forbidden_names', 'skip_names')
+
+_NO_NAMES = frozenset()
+_DEFAULT_SKIP_NAMES = frozenset({'root'})
+
+
+_COMMON_ABBREVIATIONS = frozenset({
+	'API', 'HTTP', 'HTTPS', 'XML', 'JSON', 'SQL', 'URL', 'URI', 'UUID', 'CPU', 'GPU', 'RAM', 'SSD',
+	'HDD', 'PDF', 'CSV', 'ZIP', 'GIF', 'PNG', 'JPG', 'JPEG', 'SVG', 'CSS', 'HTML', 'JS', 'TS',
+	'PHP', 'ASP', 'JSP', 'CGI', 'FTP', 'SSH', 'TCP', 'UDP', 'IP', 'DNS', 'DHCP', 'VPN', 'SSL',
+	'TLS', 'JWT', 'CRUD', 'REST', 'SOAP', 'AJAX', 'DOM', 'UI', 'UX', 'GUI', 'CLI', 'OS', 'iOS',
+	'macOS', 'AWS', 'GCP', 'IBM', 'AI', 'ML', 'NLP', 'OCR', 'QR', 'RFID', 'NFC', 'GPS', 'LED',
+	'LCD', 'OLED', 'CRT', 'ID'
+})
+
+
+@functools.lru_cache(maxsize=64)
+def _sort_abbreviations(abbreviations: frozenset) -> tuple:
+	"""
+	Order abbreviations longest first, so one is handled before any shorter one it contains.
+	Ties are broken alphabetically to keep the order independent of set iteration order.
+	"""
+	return tuple(sorted(abbreviations, key=lambda abbrev: (-len(abbrev), abbrev)))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern:
+	"""Compile a naming pattern once; rules built from the same configs share the compiled pattern."""
+	return re.compile(pattern)
+
+
 @dataclass
 class NamePatternConfig:
 	"""Configuration for name pattern validation."""
@@ -190,25 +223,21 @@ class NamePatternRule(LintingRule):
 			)
 		# Store configurations - use properties for backward compatibility access
 
-		# Advanced configurations
-		self.node_type_specific_rules = node_type_specific_rules or {}
+		# Advanced configurations - copied so generated patterns don't leak into the caller's config
+		self.node_type_specific_rules = {
+			node_type: dict(rules) for node_type, rules in (node_type_specific_rules or {}).items()
+		}
 		self.name_extractors = name_extractors or self._get_default_name_extractors()
 
 		# Common abbreviations
-		self.common_abbreviations = {
-			'API', 'HTTP', 'HTTPS', 'XML', 'JSON', 'SQL', 'URL', 'URI', 'UUID', 'CPU', 'GPU', 'RAM', 'SSD',
-			'HDD', 'PDF', 'CSV', 'ZIP', 'GIF', 'PNG', 'JPG', 'JPEG', 'SVG', 'CSS', 'HTML', 'JS', 'TS',
-			'PHP', 'ASP', 'JSP', 'CGI', 'FTP', 'SSH', 'TCP', 'UDP', 'IP', 'DNS', 'DHCP', 'VPN', 'SSL',
-			'TLS', 'JWT', 'CRUD', 'REST', 'SOAP', 'AJAX', 'DOM', 'UI', 'UX', 'GUI', 'CLI', 'OS', 'iOS',
-			'macOS', 'AWS', 'GCP', 'IBM', 'AI', 'ML', 'NLP', 'OCR', 'QR', 'RFID', 'NFC', 'GPS', 'LED',
-			'LCD', 'OLED', 'CRT', 'ID'
-		}
+		self.common_abbreviations = _COMMON_ABBREVIATIONS
 
 		# Combine user-provided and common abbreviations
 		if self.auto_detect_abbreviations:
-			self.all_abbreviations = self.allowed_abbreviations | self.common_abbreviations
+			self.all_abbreviations = frozenset(self.allowed_abbreviations) | self.common_abbreviations
 		else:
-			self.all_abbreviations = self.allowed_abbreviations
+			self.all_abbreviations = frozenset(self.allowed_abbreviations)
+		self._abbreviations_by_length = _sort_abbreviations(self.all_abbreviations)
 
 		# Set up the default pattern and description
 		self._setup_pattern()
@@ -231,15 +260,15 @@ class NamePatternRule(LintingRule):
 
 	@property
 	def forbidden_names(self) -> Set[str]:
-		return self.config.forbidden_names or set()
+		return self.config.forbidden_names or _NO_NAMES
 
 	@property
 	def skip_names(self) -> Set[str]:
-		return self.config.skip_names or {'root'}
+		return self.config.skip_names or _DEFAULT_SKIP_NAMES
 
 	@property
 	def allowed_abbreviations(self) -> Set[str]:
-		return self.config.allowed_abbreviations or set()
+		return self.config.allowed_abbreviations or _NO_NAMES
 
 	@property
 	def auto_detect_abbreviations(self) -> bool:
@@ -279,8 +308,12 @@ class NamePatternRule(LintingRule):
 				print(f"Warning: Unknown convention '{self.convention}', using PascalCase as default")
 
 	def _process_node_specific_rules(self):
-		"""Process node-specific rules to ensure they have proper patterns."""
-		for _, rules in self.node_type_specific_rules.items():
+		"""Process node-specific rules to ensure they have proper patterns and set-based name lists."""
+		for rules in self.node_type_specific_rules.values():
+			for key in _NAME_SET_KEYS:
+				if key in rules and not isinstance(rules[key], (set, frozenset)):
+					rules[key] = frozenset(rules[key])
+
 			# If the rule has a convention but no pattern, generate the pattern
 			if 'convention' in rules and 'pattern' not in rules:
 				convention = rules['convention']
@@ -355,7 +388,7 @@ class NamePatternRule(LintingRule):
 		)
 
 		processed_name = self._process_abbreviations(name, node_type)
-		if not re.match(pattern, processed_name):
+		if not _compile_pattern(pattern).match(processed_name):
 			error_msg = f"Name '{name}' doesn't follow {pattern_description} for {node_type.value}"
 
 			# Add helpful suggestions if using a predefined convention
@@ -415,8 +448,9 @@ class NamePatternRule(LintingRule):
 		# Get node-specific convention
 		convention = self._get_node_specific_config(node_type, 'convention', self.convention)
 
-		for abbrev in sorted(self.all_abbreviations, key=len, reverse=True):
-			if abbrev in name.upper():
+		upper_name = name.upper()
+		for abbrev in self._abbreviations_by_length:
+			if abbrev in upper_name:
 				if convention in ['PascalCase', 'camelCase']:
 					processed_name = self._adjust_abbreviation_for_camel_case(
 						processed_name, abbrev
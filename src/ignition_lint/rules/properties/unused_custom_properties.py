@@ -26,7 +26,7 @@ These properties are considered "used" if they are referenced in:
 """
 
 import re
-from typing import Set, Dict, Any
+from typing import Set, Dict, Any, Optional
 from ..common import LintingRule
 from ..registry import register_rule
 from ...model.node_types import NodeType
@@ -55,9 +55,13 @@ class UnusedCustomPropertiesRule(LintingRule):
 
 	def reset(self):
 		"""Reset tracking between view files."""
+		self._clear_tracking()
+		self.flattened_json = {}
+
+	def _clear_tracking(self):
+		"""Forget the properties defined and used in the previous view."""
 		self.defined_properties = {}
 		self.used_properties = set()
-		self.flattened_json = {}
 
 	def set_flattened_json(self, flattened_json: Dict[str, Any]):
 		"""Set the flattened JSON for comprehensive property reference searching."""
@@ -65,6 +69,9 @@ class UnusedCustomPropertiesRule(LintingRule):
 
 	def process_nodes(self, nodes):
 		"""Process nodes to detect unused custom properties and view parameters."""
+		# Start each view with empty tracking; the flattened JSON has already been set for this view
+		self._clear_tracking()
+
 		# Call parent process_nodes first to get standard property processing
 		super().process_nodes(nodes)
 
@@ -248,44 +255,47 @@ class UnusedCustomPropertiesRule(LintingRule):
 					f"self.custom.{prop_name}",
 				])
 
-		# Search through all values in the flattened JSON
-		for _, json_value in self.flattened_json.items():
+		# Resolve each pattern to the usage it marks once, skipping patterns that mark nothing new
+		pending_patterns = {}
+		for pattern in search_patterns:
+			used_prop = self._property_used_by_pattern(pattern)
+			if used_prop and used_prop not in self.used_properties:
+				pending_patterns[pattern] = used_prop
+
+		# Search through all values in the flattened JSON, dropping patterns once they are found
+		for json_value in self.flattened_json.values():
+			if not pending_patterns:
+				break
 			if not isinstance(json_value, str):
 				continue
 
-			# Check if any of our search patterns appear in this value
-			for pattern in search_patterns:
-				if pattern in json_value:
-					# Mark the corresponding property as used
-					self._mark_property_used_from_pattern(pattern)
+			found_patterns = [pattern for pattern in pending_patterns if pattern in json_value]
+			for pattern in found_patterns:
+				self.used_properties.add(pending_patterns.pop(pattern))
 
-	def _mark_property_used_from_pattern(self, pattern: str):
-		"""Mark a property as used based on a found pattern."""
+	def _property_used_by_pattern(self, pattern: str) -> Optional[str]:
+		"""Return the property usage a found pattern marks, or None if it marks none."""
 		# Extract the property path from the pattern
 		if 'view.custom.' in pattern:
 			# Extract property name from patterns like "view.custom.propName" or "self.view.custom.propName"
 			match = re.search(r'view\.custom\.([a-zA-Z_][a-zA-Z0-9_]*)', pattern)
 			if match:
-				prop_name = match.group(1)
-				self.used_properties.add(f"view.custom.{prop_name}")
+				return f"view.custom.{match.group(1)}"
 		elif 'view.params.' in pattern:
 			# Extract parameter name from patterns like "view.params.paramName" or "self.view.params.paramName"
 			match = re.search(r'view\.params\.([a-zA-Z_][a-zA-Z0-9_]*)', pattern)
 			if match:
-				param_name = match.group(1)
-				self.used_properties.add(f"view.params.{param_name}")
+				return f"view.params.{match.group(1)}"
 		elif '.custom.' in pattern:
 			# Extract component and property name from patterns like "ComponentName.custom.propName" or "this.custom.propName"
 			if pattern.startswith('this.custom.') or pattern.startswith('self.custom.'):
 				# Generic component reference - mark as wildcard
 				match = re.search(r'\.custom\.([a-zA-Z_][a-zA-Z0-9_]*)', pattern)
 				if match:
-					prop_name = match.group(1)
-					self.used_properties.add(f"*.custom.{prop_name}")
+					return f"*.custom.{match.group(1)}"
 			else:
 				# Specific component reference
 				match = re.search(r'([^.]+)\.custom\.([a-zA-Z_][a-zA-Z0-9_]*)', pattern)
 				if match:
-					component_name = match.group(1)
-					prop_name = match.group(2)
-					self.used_properties.add(f"{component_name}.custom.{prop_name}")
+					return f"{match.group(1)}.custom.{match.group(2)}"
+		return None
@@ -11,8 +11,6 @@ import shutil
 from typing import Dict, List, Tuple
 
 from io import StringIO
-from pylint import lint
-from pylint.reporters.text import TextReporter
 
 from ..common import ScriptRule
 from ...model.node_types import ScriptNode
@@ -135,6 +133,10 @@ class PylintScriptRule(ScriptRule):
 		if self.debug:
 			_save_debug_file(temp_file_path, debug_dir)
 
+		# pylint is only imported once scripts actually need linting; importing it is a large share of startup time
+		from pylint import lint  # pylint: disable=import-outside-toplevel
+		from pylint.reporters.text import TextReporter  # pylint: disable=import-outside-toplevel
+
 		pylint_output = StringIO()
 		args = [
 			'--disable=all',
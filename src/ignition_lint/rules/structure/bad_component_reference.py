@@ -7,9 +7,56 @@ brittle dependencies on view structure. Based on Ignition documentation, these p
 should be avoided in favor of view.custom properties or message handling.
 """
 
+import functools
+import io
+import re
+import tokenize
+
 from ..common import LintingRule
 from ...model.node_types import NodeType, ALL_SCRIPTS
 
+# Token types whose text is not executable code; f-string literal parts only exist on Python 3.12+
+_NON_CODE_TOKENS = {tokenize.COMMENT, tokenize.STRING, getattr(tokenize, 'FSTRING_MIDDLE', tokenize.STRING)}
+
+
+@functools.lru_cache(maxsize=256)
+def _strip_non_code(source):
+	"""
+	Blank out comments and string literals in a script with a single tokenize pass.
+
+	Stripped text is replaced by spaces (newlines are kept) so the remaining code keeps its
+	original layout. Scripts that cannot be tokenized are returned unchanged.
+	"""
+	line_offsets = [0]
+	for line in io.StringIO(source).readlines():
+		line_offsets.append(line_offsets[-1] + len(line))
+
+	chars = list(source)
+	try:
+		for token in tokenize.generate_tokens(io.StringIO(source).readline):
+			if token.type not in _NON_CODE_TOKENS:
+				continue
+			start = line_offsets[token.start[0] - 1] + token.start[1]
+			end = line_offsets[token.end[0] - 1] + token.end[1]
+			for i in range(start, end):
+				if chars[i] not in '\r\n':
+					chars[i] = ' '
+	except (tokenize.TokenError, SyntaxError):
+		return source
+
+	return ''.join(chars)
+
+
+def _trie_to_regex(node):
+	"""Convert a character trie of literal patterns into an equivalent regex."""
+	branches = [re.escape(char) + _trie_to_regex(child) for char, child in sorted(node.items()) if char]
+	if not branches:
+		return ''
+	if '' not in node:
+		return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+	# A pattern ending at this node already matched, so everything after it is optional
+	return f"{branches[0]}?" if len(branches) == 1 and len(branches[0]) == 1 else f"(?:{'|'.join(branches)})?"
+
 
 class BadComponentReferenceRule(LintingRule):
 	"""
@@ -22,6 +69,9 @@ class BadComponentReferenceRule(LintingRule):
 
 	These create tight coupling to view structure. Use view.custom properties
 	or message handling instead for better maintainability.
+
+	Comments and string literals in scripts are ignored. Patterns that contain a quote, such as
+	'getComponent("', are matched against the script text as written, string literals included.
 	"""
 
 	def __init__(self, forbidden_patterns=None, case_sensitive=True, severity="error"):
@@ -50,6 +100,31 @@ class BadComponentReferenceRule(LintingRule):
 		]
 		# Allow case-insensitive matching
 		self.case_sensitive = case_sensitive
+		# Patterns in the form they are matched against content, plus one regex that finds any of them
+		if case_sensitive:
+			self._patterns_to_check = list(self.forbidden_patterns)
+		else:
+			self._patterns_to_check = [pattern.lower() for pattern in self.forbidden_patterns]
+		self._any_pattern_re = self._build_regex(tuple(self._patterns_to_check))
+		# Blanking string literals would hide the quotes these patterns look for
+		self._quoted_patterns = {pattern for pattern in self._patterns_to_check if '"' in pattern or "'" in pattern}
+
+	@staticmethod
+	@functools.lru_cache(maxsize=None)
+	def _build_regex(patterns):
+		"""
+		Compile one regex matching any of the literal patterns, shared between rule instances.
+
+		The patterns are merged into a trie first, so shared prefixes (such as '.get' or 'self.')
+		are matched once per position instead of once per pattern.
+		"""
+		trie = {}
+		for pattern in patterns:
+			node = trie
+			for char in pattern:
+				node = node.setdefault(char, {})
+			node[''] = {}  # A pattern ends here
+		return re.compile(_trie_to_regex(trie))
 
 	@property
 	def error_message(self) -> str:
@@ -86,18 +161,22 @@ class BadComponentReferenceRule(LintingRule):
 		if not content:
 			return
 
-		# Prepare content for checking
-		check_content = content
-		if not self.case_sensitive:
-			check_content = content.lower()
-			patterns_to_check = [pattern.lower() for pattern in self.forbidden_patterns]
-		else:
-			patterns_to_check = self.forbidden_patterns
+		# Most content is clean, so a single regex scan of the raw text rules it out before any tokenizing
+		raw_content = content if self.case_sensitive else content.lower()
+		if not self._any_pattern_re.search(raw_content):
+			return
+
+		# Only scripts that may contain a pattern pay for stripping their comments and strings
+		check_content = raw_content
+		if content_type == "script":
+			check_content = _strip_non_code(content)
+			if not self.case_sensitive:
+				check_content = check_content.lower()
 
 		# Find all matching patterns for better error reporting
 		found_patterns = []
-		for i, pattern in enumerate(patterns_to_check):
-			if pattern in check_content:
+		for i, pattern in enumerate(self._patterns_to_check):
+			if pattern in (raw_content if pattern in self._quoted_patterns else check_content):
 				# Get the original pattern name for reporting
 				original_pattern = self.forbidden_patterns[i]
 				found_patterns.append(original_pattern)
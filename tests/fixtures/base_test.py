@@ -3,36 +3,82 @@
 Base test classes providing common functionality for ignition-lint tests.
 """
 
+import copy
+import json
 import unittest
 import os
 import sys
-import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Union
 
 # Add the src directory to the PYTHONPATH
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 
 from ignition_lint.linter import LintEngine
+from ignition_lint.model.builder import ViewModelBuilder
 from ignition_lint.rules import RULES_MAP
-from ignition_lint.common.flatten_json import flatten_file
+from .test_helpers import (
+	create_temp_view_file, flatten_view_data, load_flattened_view, load_test_view, load_view_model
+)
 
 
-class BaseRuleTest(unittest.TestCase):
-	"""Base class for testing individual linting rules."""
-	def __init__(self, methodName='runTest'):
-		super().__init__(methodName)
-		self.test_cases_dir = None
-		self.configs_dir = None
-		self.rule_config = None
-		self.last_results = None  # Store results from last run_lint call
+# A view on disk, or parsed view data linted in memory
+ViewSource = Union[Path, Dict[str, Any]]
+
+
+def _config_key(rule_configs: Dict[str, Dict[str, Any]]) -> str:
+	"""Canonical JSON of the rule configs, so equal configurations share cache entries."""
+	return json.dumps(rule_configs, sort_keys=True, default=str)
+
+
+def _lint_cache_key(view_file: Path, rule_configs: Dict[str, Dict[str, Any]]) -> tuple:
+	"""
+	Key cached lint results by the view file and the canonical JSON of the rule configs.
+
+	The file's mtime and size are part of the key so a rewritten file, or a temporary path reused
+	for a different view, is never served stale results.
+	"""
+	stat = view_file.stat()
+	return str(view_file.resolve()), stat.st_mtime_ns, stat.st_size, _config_key(rule_configs)
+
+
+class _ClassFixturesMixin:
+	"""Class-level test directories, view lookups, lint caches and engine creation shared by the base test classes."""
+	# Test cases every test in the class lints; the whole class is skipped if any of them is missing
+	required_cases = ()
+	# Leave rule names missing from RULES_MAP out of the engine instead of failing the test
+	skip_unknown_rules = False
 
-	def setUp(self): # pylint: disable=invalid-name
-		"""Set up test fixtures."""
+	@classmethod
+	def setUpClass(cls):  # pylint: disable=invalid-name
+		"""Set up fixtures shared by every test in the class, starting with empty lint result and engine caches."""
+		super().setUpClass()
+		cls._lint_cache = {}
+		cls._engines = {}
 		# Get the tests directory (two levels up from fixtures)
 		tests_dir = Path(__file__).parent.parent
-		self.test_cases_dir = tests_dir / "cases"
-		self.configs_dir = tests_dir / "configs"
+		cls.test_cases_dir = tests_dir / "cases"
+		cls.configs_dir = tests_dir / "configs"
+		cls._views = {}
+		missing_cases = [case for case in cls.required_cases if not (cls.test_cases_dir / case / "view.json").exists()]
+		if missing_cases:
+			raise unittest.SkipTest(f"Test cases not found: {', '.join(missing_cases)}")
+
+	@classmethod
+	def tearDownClass(cls):  # pylint: disable=invalid-name
+		"""Release the cached lint results and engines of this class."""
+		cls._lint_cache.clear()
+		cls._engines.clear()
+		super().tearDownClass()
+
+	@classmethod
+	def get_view(cls, case_name: str) -> Path:
+		"""Return the view.json path for a test case, looked up once per test class."""
+		if case_name not in cls._views:
+			cls._views[case_name] = load_test_view(cls.test_cases_dir, case_name)
+		return cls._views[case_name]
 
 	def create_lint_engine(self, rule_configs: Dict[str, Dict[str, Any]]) -> LintEngine:
 		"""
@@ -47,6 +93,8 @@ class BaseRuleTest(unittest.TestCase):
 		rules = []
 		for rule_name, config in rule_configs.items():
 			if rule_name not in RULES_MAP:
+				if self.skip_unknown_rules:
+					continue
 				self.fail(f"Unknown rule: {rule_name}")
 
 			rule_class = RULES_MAP[rule_name]
@@ -60,25 +108,85 @@ class BaseRuleTest(unittest.TestCase):
 
 		return LintEngine(rules)
 
-	def run_lint_on_file(self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]]):
+
+class BaseRuleTest(_ClassFixturesMixin, unittest.TestCase):
+	"""Base class for testing individual linting rules."""
+	# Subclasses that lint with one configuration set it here, built once when the class is defined
+	rule_config = None
+
+	def __init__(self, methodName='runTest'):
+		super().__init__(methodName)
+		self.last_results = None  # Store results from last run_lint call
+
+	def _get_lint_engine(self, rule_configs: Dict[str, Dict[str, Any]]) -> LintEngine:
+		"""
+		Return the engine for a rule configuration, built once per test class.
+
+		Rules reset their violations at the start of every pass, so one engine can lint many views.
+		"""
+		key = _config_key(rule_configs)
+		if key not in self._engines:
+			self._engines[key] = self.create_lint_engine(rule_configs)
+		return self._engines[key]
+
+	def run_lint_on_file(self, view_file: ViewSource, rule_configs: Dict[str, Dict[str, Any]], use_cache: bool = True):
 		"""
 		Run linting on a view file and store results for access via convenience methods.
 
+		Results are cached per test class by (view file, rule configuration), so tests repeating
+		a lint pass over the same inputs share one run. Parsed view data (a dict, for example from
+		create_mock_view_dict) is linted in memory instead, so the assert helpers accept it too.
+
 		Args:
-			view_file: Path to the view.json file
+			view_file: Path to the view.json file, or parsed view data
 			rule_configs: Rule configurations
+			use_cache: Set to False to force a fresh lint pass
 
 		Returns:
 			LintResults object with separate warnings and errors
 		"""
+		if isinstance(view_file, dict):
+			return self._run_lint_on_data(view_file, rule_configs)
 		if not view_file.exists():
 			self.skipTest(f"View file not found: {view_file}")
 
-		lint_engine = self.create_lint_engine(rule_configs)
-		flattened_json = flatten_file(view_file)
-		self.last_results = lint_engine.process(flattened_json)
+		key = _lint_cache_key(view_file, rule_configs) if use_cache else None
+		if key in self._lint_cache:
+			# Hand out a copy so a test mutating its results cannot leak into another test
+			self.last_results = copy.deepcopy(self._lint_cache[key])
+			return self.last_results
+
+		flattened_json = load_flattened_view(view_file)
+		view_model = load_view_model(view_file)
+		self.last_results = self._get_lint_engine(rule_configs).process(flattened_json, view_model=view_model)
+		if use_cache:
+			self._lint_cache[key] = copy.deepcopy(self.last_results)
 		return self.last_results
 
+	def assert_lint_runs(self, view_file: ViewSource, rule_configs: Dict[str, Dict[str, Any]]):
+		"""
+		Assert that linting a view file completes without raising, for tests that only check a rule runs.
+
+		These checks are skipped when TEST_SKIP_SMOKE=1 is set, for a quicker run of the tests that
+		assert on actual violations.
+
+		Args:
+			view_file: Path to the view.json file, or parsed view data
+			rule_configs: Rule configurations
+
+		Returns:
+			LintResults object with separate warnings and errors
+		"""
+		if os.environ.get("TEST_SKIP_SMOKE") == "1":
+			self.skipTest("smoke-only lint check skipped (TEST_SKIP_SMOKE=1)")
+		try:
+			return self.run_lint_on_file(view_file, rule_configs)
+		except (unittest.SkipTest, AssertionError):
+			raise
+		except Exception as e:
+			label = view_file.name if isinstance(view_file, Path) else "view data"
+			self.fail(f"Linting {label} raised {type(e).__name__}: {e}")
+
 	def run_lint_on_mock_view(self, mock_view_content: str, rule_configs: Dict[str, Dict[str, Any]]):
 		"""
 		Run linting on mock view JSON content and store results for convenience method access.
@@ -90,16 +198,29 @@ class BaseRuleTest(unittest.TestCase):
 		Returns:
 			LintResults object with separate warnings and errors
 		"""
-		# Create a temporary file with the mock content
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			f.write(mock_view_content)
-			temp_file = Path(f.name)
+		return self._run_lint_on_data(json.loads(mock_view_content, object_pairs_hook=OrderedDict), rule_configs)
 
-		try:
-			return self.run_lint_on_file(temp_file, rule_configs)
-		finally:
-			# Clean up the temporary file
-			temp_file.unlink(missing_ok=True)
+	def _run_lint_on_data(self, view_data: Dict[str, Any], rule_configs: Dict[str, Dict[str, Any]]):
+		"""
+		Run linting on parsed view data without writing it to a file, and store the results.
+
+		Args:
+			view_data: Parsed view.json content
+			rule_configs: Rule configurations
+
+		Returns:
+			LintResults object with separate warnings and errors
+		"""
+		flattened_json = flatten_view_data(view_data)
+		view_model = ViewModelBuilder().build_model(flattened_json)
+		self.last_results = self._get_lint_engine(rule_configs).process(flattened_json, view_model=view_model)
+		return self.last_results
+
+	def create_temp_view_file(self, view_content: str) -> Path:
+		"""Create a temporary view.json file that is removed automatically when the test finishes."""
+		temp_file = create_temp_view_file(view_content)
+		self.addCleanup(temp_file.unlink, missing_ok=True)
+		return temp_file
 
 	# Convenience methods for accessing results from last run_lint call
 	def get_error_count(self, rule_name: str = None) -> int:
@@ -146,7 +267,7 @@ class BaseRuleTest(unittest.TestCase):
 		self.assertEqual(error_count + warning_count, 0,
 			f"Expected no issues for {scope} but found {error_count} errors and {warning_count} warnings")
 
-	def assert_rule_passes(self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str):
+	def assert_rule_passes(self, view_file: ViewSource, rule_configs: Dict[str, Dict[str, Any]], rule_name: str):
 		"""Assert that a rule passes (no errors) for a given view file. Warnings are allowed."""
 		self.run_lint_on_file(view_file, rule_configs)
 
@@ -157,7 +278,7 @@ class BaseRuleTest(unittest.TestCase):
 			print(f"Note: Rule {rule_name} passed but produced warnings: {self.get_warnings_for_rule(rule_name)}")
 
 	def assert_rule_fails(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
+		self, view_file: ViewSource, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
 		expected_error_count: int = None
 	):
 		"""Assert that a rule fails (has errors) for a given view file."""
@@ -173,22 +294,25 @@ class BaseRuleTest(unittest.TestCase):
 			)
 
 	def assert_error_contains(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str, error_pattern: str
+		self, view_file: ViewSource, rule_configs: Dict[str, Dict[str, Any]], rule_name: str, error_pattern: str
 	):
 		"""Assert that rule errors contain a specific pattern."""
 		self.run_lint_on_file(view_file, rule_configs)
 
-		rule_errors = self.get_errors_for_rule(rule_name)
-		matching_errors = [error for error in rule_errors if error_pattern in error]
-		self.assertGreater(
-			len(matching_errors), 0,
-			f"Rule {rule_name} errors should contain '{error_pattern}'. Found errors: {rule_errors}"
-		)
+		self._assert_patterns_found(rule_name, 'errors', self.get_errors_for_rule(rule_name), [error_pattern])
+
+	def _assert_patterns_found(self, rule_name: str, kind: str, messages: List[str], patterns: List[str]):
+		"""Assert that every pattern appears in at least one message, stopping at the first message that matches."""
+		for pattern in patterns:
+			self.assertTrue(
+				any(pattern in message for message in messages),
+				f"Rule {rule_name} {kind} should contain '{pattern}'. Found {kind}: {messages}"
+			)
 
 	# Detailed assertion methods for warnings and errors
 
 	def assert_violations(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
+		self, view_file: ViewSource, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
 		expected_warnings: int = 0, expected_errors: int = 0,
 		warning_patterns: list = None, error_patterns: list = None
 	):
@@ -214,24 +338,14 @@ class BaseRuleTest(unittest.TestCase):
 
 		# Check warning patterns if provided
 		if warning_patterns:
-			for pattern in warning_patterns:
-				matching_warnings = [warning for warning in rule_warnings if pattern in warning]
-				self.assertGreater(
-					len(matching_warnings), 0,
-					f"Rule {rule_name} warnings should contain '{pattern}'. Found warnings: {rule_warnings}"
-				)
+			self._assert_patterns_found(rule_name, 'warnings', rule_warnings, warning_patterns)
 
 		# Check error patterns if provided
 		if error_patterns:
-			for pattern in error_patterns:
-				matching_errors = [error for error in rule_errors if pattern in error]
-				self.assertGreater(
-					len(matching_errors), 0,
-					f"Rule {rule_name} errors should contain '{pattern}'. Found errors: {rule_errors}"
-				)
+			self._assert_patterns_found(rule_name, 'errors', rule_errors, error_patterns)
 
 	def assert_rule_warnings(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
+		self, view_file: ViewSource, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
 		expected_warning_count: int, warning_patterns: list = None
 	):
 		"""Assert that a rule produces the expected number of warnings with optional pattern matching."""
@@ -246,15 +360,10 @@ class BaseRuleTest(unittest.TestCase):
 		)
 
 		if warning_patterns:
-			for pattern in warning_patterns:
-				matching_warnings = [warning for warning in rule_warnings if pattern in warning]
-				self.assertGreater(
-					len(matching_warnings), 0,
-					f"Rule {rule_name} warnings should contain '{pattern}'. Found warnings: {rule_warnings}"
-				)
+			self._assert_patterns_found(rule_name, 'warnings', rule_warnings, warning_patterns)
 
 	def assert_rule_errors(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
+		self, view_file: ViewSource, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
 		expected_error_count: int, error_patterns: list = None
 	):
 		"""Assert that a rule produces the expected number of errors with optional pattern matching."""
@@ -269,22 +378,17 @@ class BaseRuleTest(unittest.TestCase):
 		)
 
 		if error_patterns:
-			for pattern in error_patterns:
-				matching_errors = [error for error in rule_errors if pattern in error]
-				self.assertGreater(
-					len(matching_errors), 0,
-					f"Rule {rule_name} errors should contain '{pattern}'. Found errors: {rule_errors}"
-				)
+			self._assert_patterns_found(rule_name, 'errors', rule_errors, error_patterns)
 
 	def assert_rule_passes_completely(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str
+		self, view_file: ViewSource, rule_configs: Dict[str, Dict[str, Any]], rule_name: str
 	):
 		"""Assert that a rule passes completely (no warnings or errors)."""
 		self.run_lint_on_file(view_file, rule_configs)
 		self.assert_no_issues(rule_name)
 
 	def assert_rule_summary(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
+		self, view_file: ViewSource, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
 		expected_warnings: int = 0, expected_errors: int = 0
 	):
 		"""Assert the total warnings and errors count for a rule."""
@@ -303,28 +407,25 @@ class BaseRuleTest(unittest.TestCase):
 		)
 
 
-class BaseIntegrationTest(unittest.TestCase):
+class BaseIntegrationTest(_ClassFixturesMixin, unittest.TestCase):
 	"""Base class for integration tests involving multiple components."""
+	skip_unknown_rules = True
 
-	def setUp(self):
-		"""Set up test fixtures."""
-		# Get the tests directory (two levels up from fixtures)
-		tests_dir = Path(__file__).parent.parent
-		self.test_cases_dir = tests_dir / "cases"
-		self.configs_dir = tests_dir / "configs"
-
-	def run_multiple_rules(self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+	def run_multiple_rules(
+		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], use_cache: bool = True
+	) -> Dict[str, List[str]]:
 		"""
 		Run multiple rules on a view file.
 
 		Args:
 			view_file: Path to the view.json file
 			rule_configs: Dictionary of rule configurations
+			use_cache: Set to False to force a fresh lint pass
 
 		Returns:
 			Dictionary of combined warnings and errors by rule name
 		"""
-		results = self.run_multiple_rules_detailed(view_file, rule_configs)
+		results = self.run_multiple_rules_detailed(view_file, rule_configs, use_cache=use_cache)
 
 		# Combine warnings and errors
 		combined_results = {}
@@ -333,13 +434,52 @@ class BaseIntegrationTest(unittest.TestCase):
 
 		return combined_results
 
-	def run_multiple_rules_detailed(self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]]):
+	def run_multiple_rules_on_cases(
+		self, case_names: List[str], rule_configs: Dict[str, Dict[str, Any]]
+	) -> Dict[str, Optional[Dict[str, List[str]]]]:
+		"""
+		Run multiple rules on several test case views.
+
+		The cases are independent, so with TEST_PARALLEL=1 set they are linted concurrently in a
+		thread pool. Results are always returned in case order.
+
+		Args:
+			case_names: Names of the test case subdirectories
+			rule_configs: Dictionary of rule configurations
+
+		Returns:
+			Dictionary of combined warnings and errors by case name, or None for missing cases
+		"""
+		view_files = {}
+		for case in case_names:
+			try:
+				view_files[case] = self.get_view(case)
+			except FileNotFoundError:
+				view_files[case] = None
+
+		def run_case(case):
+			view_file = view_files[case]
+			return self.run_multiple_rules(view_file, rule_configs) if view_file else None
+
+		if os.environ.get("TEST_PARALLEL") == "1" and len(case_names) > 1:
+			with ThreadPoolExecutor(max_workers=len(case_names)) as executor:
+				return dict(zip(case_names, executor.map(run_case, case_names)))
+
+		return {case: run_case(case) for case in case_names}
+
+	def run_multiple_rules_detailed(
+		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], use_cache: bool = True
+	):
 		"""
 		Run multiple rules on a view file and return detailed results.
 
+		Results are cached per test class by (view file, rule configuration), so repeated
+		lint passes over the same inputs are only computed once.
+
 		Args:
 			view_file: Path to the view.json file
 			rule_configs: Dictionary of rule configurations
+			use_cache: Set to False to force a fresh lint pass
 
 		Returns:
 			LintResults object with separate warnings and errors
@@ -347,25 +487,20 @@ class BaseIntegrationTest(unittest.TestCase):
 		if not view_file.exists():
 			self.skipTest(f"View file not found: {view_file}")
 
-		# Create rules
-		rules = []
-		for rule_name, config in rule_configs.items():
-			if rule_name not in RULES_MAP:
-				continue
-
-			rule_class = RULES_MAP[rule_name]
-			kwargs = config.get('kwargs', {})
+		if not use_cache:
+			return self._run_multiple_rules_impl(view_file, rule_configs)
 
-			try:
-				# Use create_from_config to enable preprocessing
-				rules.append(rule_class.create_from_config(kwargs))
-			except Exception as e:
-				self.fail(f"Failed to create rule {rule_name}: {e}")
+		key = _lint_cache_key(view_file, rule_configs)
+		if key not in self._lint_cache:
+			self._lint_cache[key] = self._run_multiple_rules_impl(view_file, rule_configs)
+		# Hand out a copy so a test mutating its results cannot leak into another test
+		return copy.deepcopy(self._lint_cache[key])
 
-		# Run linting
-		lint_engine = LintEngine(rules)
-		flattened_json = flatten_file(view_file)
-		return lint_engine.process(flattened_json)
+	def _run_multiple_rules_impl(self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]]):
+		"""Build the configured rules and lint the view file without consulting the cache."""
+		lint_engine = self.create_lint_engine(rule_configs)
+		flattened_json = load_flattened_view(view_file)
+		return lint_engine.process(flattened_json, view_model=load_view_model(view_file))
 
 	def assert_total_errors(self, errors: Dict[str, List[str]], expected_total: int):
 		"""Assert the total number of errors across all rules."""
@@ -2,11 +2,17 @@
 Helper functions and utilities for ignition-lint tests.
 """
 
+import functools
 import json
+import os
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, List
 
+from ignition_lint.common.flatten_json import flatten_file, flatten_json
+from ignition_lint.model.builder import ViewModelBuilder
+
 
 def create_mock_view(components: List[Dict[str, Any]], custom_properties: Dict[str, Any] = None) -> str:
 	"""
@@ -19,6 +25,20 @@ def create_mock_view(components: List[Dict[str, Any]], custom_properties: Dict[s
 	Returns:
 		JSON string representing the view
 	"""
+	return json.dumps(create_mock_view_dict(components, custom_properties), indent=2)
+
+
+def create_mock_view_dict(components: List[Dict[str, Any]], custom_properties: Dict[str, Any] = None) -> Dict[str, Any]:
+	"""
+	Create mock view data for testing without serializing it.
+
+	Args:
+		components: List of component definitions
+		custom_properties: Additional properties to add to the view
+
+	Returns:
+		Dictionary representing the view
+	"""
 	view_data = {"meta": {"name": "root"}, "type": "ia.container.coord", "version": 0, "props": {}}
 
 	if custom_properties:
@@ -44,7 +64,7 @@ def create_mock_view(components: List[Dict[str, Any]], custom_properties: Dict[s
 
 		view_data["props"]["children"] = children
 
-	return json.dumps(view_data, indent=2)
+	return view_data
 
 
 def create_temp_view_file(view_content: str) -> Path:
@@ -57,9 +77,12 @@ def create_temp_view_file(view_content: str) -> Path:
 	Returns:
 		Path to the temporary file
 	"""
-	with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-		f.write(view_content)
-		return Path(f.name)
+	fd, temp_path = tempfile.mkstemp(suffix='.json')
+	try:
+		os.write(fd, view_content.encode('utf-8'))
+	finally:
+		os.close(fd)
+	return Path(temp_path)
 
 
 def assert_rule_errors(
@@ -97,10 +120,11 @@ def assert_no_errors(errors: Dict[str, List[str]], rule_name: str = None):
 	"""
 	if rule_name:
 		rule_errors = errors.get(rule_name, [])
-		assert rule_errors == [], f"Rule {rule_name} should have no errors but found: {rule_errors}"
-	else:
+		assert not rule_errors, f"Rule {rule_name} should have no errors but found: {rule_errors}"
+	elif any(errors.values()):
+		# Only count the errors once we know the assertion is going to fail
 		total_errors = sum(len(rule_errors) for rule_errors in errors.values())
-		assert total_errors == 0, f"Should have no errors but found: {errors}"
+		raise AssertionError(f"Should have no errors but found {total_errors}: {errors}")
 
 
 def get_test_config(rule_name: str, **kwargs) -> Dict[str, Dict[str, Any]]:
@@ -139,6 +163,100 @@ def load_test_view(test_cases_dir: Path, case_name: str) -> Path:
 	return view_file
 
 
+def discover_test_cases(test_cases_dir: Path) -> Dict[str, List[Path]]:
+	"""
+	Find the test case directories that contain view files.
+
+	The directory tree is only walked once per process; the test cases do not change during a run.
+
+	Args:
+		test_cases_dir: Path to test cases directory
+
+	Returns:
+		Dict mapping case names to the view.json files found under each case directory
+	"""
+	return {case_name: list(view_files) for case_name, view_files in _discover_test_cases(Path(test_cases_dir).resolve())}
+
+
+@functools.lru_cache(maxsize=None)
+def _discover_test_cases(test_cases_dir: Path) -> tuple:
+	"""Walk the test cases directory once, returning sorted (case name, view files) pairs."""
+	if not test_cases_dir.is_dir():
+		return ()
+	discovered_cases = []
+	for case_dir in sorted(test_cases_dir.iterdir()):
+		if case_dir.is_dir():
+			view_files = tuple(sorted(case_dir.glob("**/view.json")))
+			if view_files:
+				discovered_cases.append((case_dir.name, view_files))
+	return tuple(discovered_cases)
+
+
+def flatten_view_data(view_data: Dict[str, Any]) -> OrderedDict:
+	"""
+	Flatten already parsed view data the same way flatten_file flattens a view file.
+
+	Args:
+		view_data: Parsed view.json content
+
+	Returns:
+		Sorted flattened JSON data
+	"""
+	return OrderedDict(sorted(flatten_json(view_data).items()))
+
+
+@functools.lru_cache(maxsize=64)
+def _flatten_view_file(view_file: Path, mtime_ns: int, size: int) -> OrderedDict:  # pylint: disable=unused-argument
+	"""Flatten a view file once per (path, mtime, size); the stat values only invalidate the cache."""
+	return flatten_file(view_file)
+
+
+def load_flattened_view(view_file: Path) -> OrderedDict:
+	"""
+	Load and flatten a view file, reusing the result from earlier calls while the file is unchanged.
+
+	The result is shared between callers; deepcopy it before modifying it.
+
+	Args:
+		view_file: Path to the view.json file
+
+	Returns:
+		Sorted flattened JSON data
+	"""
+	view_file = Path(view_file).resolve()
+	stat = view_file.stat()
+	return _flatten_view_file(view_file, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_view_model(view_file: Path, mtime_ns: int, size: int) -> Dict[str, List[Any]]:
+	"""Build the view model once per (path, mtime, size) from the cached flattened view."""
+	return ViewModelBuilder().build_model(_flatten_view_file(view_file, mtime_ns, size))
+
+
+def load_view_model(view_file: Path) -> Dict[str, List[Any]]:
+	"""
+	Load the view model for a view file, reusing the result from earlier calls while the file is unchanged.
+
+	The model is shared between callers and must not be modified; pass it to LintEngine.process
+	together with the flattened view from load_flattened_view.
+
+	Args:
+		view_file: Path to the view.json file
+
+	Returns:
+		Dict mapping node collections to lists of nodes
+	"""
+	view_file = Path(view_file).resolve()
+	stat = view_file.stat()
+	return _build_view_model(view_file, stat.st_mtime_ns, stat.st_size)
+
+
+# Placeholders rendered into the cached mock script templates
+_MOCK_SOURCE_PLACEHOLDER = "__MOCK_SCRIPT_SOURCE__"
+_MOCK_COMPONENT_PLACEHOLDER = "__MOCK_COMPONENT_NAME__"
+
+
 def create_mock_script(script_type: str, source_code: str, component_name: str = "TestComponent") -> str:
 	"""
 	Create a mock view.json with a script for testing script-based rules.
@@ -151,6 +269,22 @@ def create_mock_script(script_type: str, source_code: str, component_name: str =
 	Returns:
 		JSON string representing the view with the script
 	"""
+	# Splice the JSON-encoded values into the pre-rendered template; this gives the same output as
+	# dumping the full view, which json.dumps can only do with its pure-Python encoder when indenting
+	template = _mock_script_template(script_type)
+	return template.replace(json.dumps(_MOCK_COMPONENT_PLACEHOLDER), json.dumps(component_name)).replace(
+		json.dumps(_MOCK_SOURCE_PLACEHOLDER), json.dumps(source_code)
+	)
+
+
+@functools.lru_cache(maxsize=None)
+def _mock_script_template(script_type: str) -> str:
+	"""Render the mock view for a script type once, with placeholders for the script and component name."""
+	return _build_mock_script_view(script_type, _MOCK_SOURCE_PLACEHOLDER, _MOCK_COMPONENT_PLACEHOLDER)
+
+
+def _build_mock_script_view(script_type: str, source_code: str, component_name: str) -> str:
+	"""Build the mock view.json for a script type."""
 
 	if script_type == "message_handler":
 		# Message handlers are at root level scripts.messageHandlers
@@ -6,7 +6,6 @@ Tests the command-line interface functionality.
 
 import unittest
 import subprocess
-import tempfile
 import json
 import sys
 from pathlib import Path
@@ -54,7 +53,7 @@ class TestCLIIntegration(BaseIntegrationTest):
 				except (subprocess.TimeoutExpired, FileNotFoundError):
 					pass
 
-	def _run_cli_command(self, args, timeout=30):
+	def _run_cli_command(self, args, timeout=30, input_text=None):
 		"""Run a CLI command using the best available method."""
 		if self.use_poetry:
 			cmd = ["poetry", "run", "ignition-lint"] + args
@@ -68,7 +67,9 @@ class TestCLIIntegration(BaseIntegrationTest):
 		else:
 			raise unittest.SkipTest("No viable CLI execution method found")
 
-		return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=False, cwd=cwd)
+		return subprocess.run(
+			cmd, input=input_text, capture_output=True, text=True, timeout=timeout, check=False, cwd=cwd
+		)
 
 	def test_cli_help(self):
 		"""Test CLI help command."""
@@ -96,22 +97,17 @@ class TestCLIIntegration(BaseIntegrationTest):
 
 	def test_cli_with_config_file(self):
 		"""Test CLI with a configuration file."""
-		# Create a temporary config file
+		# Pipe the config through stdin rather than writing it to a temporary file
 		config = {"NamePatternRule": {"enabled": True, "kwargs": {"convention": "PascalCase"}}}
 
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(config, f)
-			config_file = f.name
-
 		try:
 			view_file = self.test_cases_dir / "PascalCase" / "view.json"
 			if not view_file.exists():
 				self.skipTest("PascalCase test file not found")
 
-			result = self._run_cli_command([
-				"--config", config_file, "--files",
-				str(view_file), "--verbose"
-			])
+			result = self._run_cli_command(
+				["--config", "-", "--files", str(view_file), "--verbose"], input_text=json.dumps(config)
+			)
 
 			# Debug output if test fails
 			if result.returncode not in [0, 1]:  # 0 = no errors, 1 = errors found
@@ -125,6 +121,7 @@ class TestCLIIntegration(BaseIntegrationTest):
 				f"CLI should return 0 (no errors) or 1 (errors found), got {result.returncode}. "
 				f"STDERR: {result.stderr}"
 			)
+			self.assertIn("Loaded configuration from -", result.stdout)
 
 		except (subprocess.TimeoutExpired, FileNotFoundError) as e:
 			self.skipTest(f"CLI test skipped: {e}")
@@ -132,12 +129,6 @@ class TestCLIIntegration(BaseIntegrationTest):
 			raise
 		except Exception as e:
 			self.fail(f"Unexpected error running CLI with config: {e}")
-		finally:
-			# Clean up
-			try:
-				Path(config_file).unlink(missing_ok=True)
-			except Exception as e:
-				pass
 
 	def test_cli_stats_only(self):
 		"""Test CLI stats-only mode."""
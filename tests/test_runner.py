@@ -6,10 +6,13 @@ This script provides a simple command-line interface for running organized tests
 """
 
 import argparse
+import io
 import json
 import os
 import sys
+import time
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add the src directory to the PYTHONPATH
@@ -17,11 +20,16 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 
 # ConfigurableTestFramework is used indirectly via test_config_framework.py
 
+# Resolved once; every test path below is built from it
+_BASE_DIR = Path(__file__).parent.resolve()
 
+# One loader for every discovery and module load in this process
+_LOADER = unittest.TestLoader()
 
-def discover_and_run_unit_tests(test_pattern=None, verbosity=2):
+
+def discover_and_run_unit_tests(test_pattern=None, verbosity=2, workers=1):
 	"""Discover and run unit tests from the unit/ directory."""
-	test_dir = Path(__file__).parent / "unit"
+	test_dir = _BASE_DIR / "unit"
 	print("=" * 60)
 	print("RUNNING UNIT TESTS")
 	print("=" * 60)
@@ -30,23 +38,12 @@ def discover_and_run_unit_tests(test_pattern=None, verbosity=2):
 		print(f"Unit tests directory not found: {test_dir}")
 		return False
 
-	# Discover tests
-	loader = unittest.TestLoader()
-	if test_pattern:
-		suite = loader.discover(str(test_dir), pattern=test_pattern)
-	else:
-		suite = loader.discover(str(test_dir), pattern="test_*.py")
-
-	# Run tests
-	runner = unittest.TextTestRunner(verbosity=verbosity)
-	result = runner.run(suite)
-
-	return result.wasSuccessful()
+	return _run_tests_in_dir(test_dir, test_pattern or "test_*.py", verbosity, workers)
 
 
-def discover_and_run_integration_tests(test_pattern=None, verbosity=2):
+def discover_and_run_integration_tests(test_pattern=None, verbosity=2, workers=1):
 	"""Discover and run integration tests from the integration/ directory."""
-	test_dir = Path(__file__).parent / "integration"
+	test_dir = _BASE_DIR / "integration"
 
 	print("\n" + "=" * 60)
 	print("RUNNING INTEGRATION TESTS")
@@ -56,23 +53,133 @@ def discover_and_run_integration_tests(test_pattern=None, verbosity=2):
 		print(f"Integration tests directory not found: {test_dir}")
 		return False
 
-	# Discover tests
-	loader = unittest.TestLoader()
-	if test_pattern:
-		suite = loader.discover(str(test_dir), pattern=test_pattern)
-	else:
-		suite = loader.discover(str(test_dir), pattern="test_*.py")
+	return _run_tests_in_dir(test_dir, test_pattern or "test_*.py", verbosity, workers)
+
+
+def run_all_tests(unit_pattern=None, integration_pattern=None, verbosity=2, workers=1):
+	"""Discover unit and integration tests and run them as a single suite."""
+	base_dir = _BASE_DIR
+	print("=" * 60)
+	print("RUNNING UNIT AND INTEGRATION TESTS")
+	print("=" * 60)
+
+	suites = []
+	for test_dir, pattern in ((base_dir / "unit", unit_pattern), (base_dir / "integration", integration_pattern)):
+		if not test_dir.exists():
+			print(f"Tests directory not found: {test_dir}")
+			return False
+		suites.append(_discover(test_dir, pattern or "test_*.py"))
+
+	return _run_suite(unittest.TestSuite(suites), verbosity, workers)
+
+
+def _discover(test_dir, pattern):
+	"""Discover the tests in a directory; the top level is pinned to the tests/ directory."""
+	return _LOADER.discover(str(test_dir), pattern=pattern, top_level_dir=str(_BASE_DIR))
+
+
+def _run_tests_in_dir(test_dir, pattern, verbosity, workers):
+	"""Run the tests in a directory, serially in-process or spread across worker processes."""
+	return _run_suite(_discover(test_dir, pattern), verbosity, workers)
+
+
+def _run_suite(suite, verbosity, workers):
+	"""Run a suite in-process, or across a pool of worker processes when workers is not 1."""
+	if workers != 1:
+		return _run_suite_in_parallel(suite, verbosity, workers)
 
-	# Run tests
 	runner = unittest.TextTestRunner(verbosity=verbosity)
 	result = runner.run(suite)
 
 	return result.wasSuccessful()
 
 
+def _iter_tests(suite):
+	"""Yield the individual test cases of a (nested) test suite."""
+	for test in suite:
+		if isinstance(test, unittest.TestSuite):
+			yield from _iter_tests(test)
+		else:
+			yield test
+
+
+def _run_test_class(test_name, verbosity):
+	"""Run one test class by name in a worker process and return its output and result counts."""
+	suite = unittest.defaultTestLoader.loadTestsFromName(test_name)
+	return _run_captured(suite, verbosity)
+
+
+def _run_captured(suite, verbosity):
+	"""Run a suite, capturing the per-test and error output the text runner would print."""
+	stream = io.StringIO()
+	runner = unittest.TextTestRunner(stream=stream, verbosity=verbosity)
+	result = runner._makeResult()  # pylint: disable=protected-access
+	suite(result)
+	result.printErrors()
+	counts = (
+		result.testsRun, len(result.failures), len(result.errors), len(result.skipped), len(result.expectedFailures),
+		len(result.unexpectedSuccesses)
+	)
+	return stream.getvalue(), counts
+
+
+def _run_suite_in_parallel(suite, verbosity, workers):
+	"""
+	Run the test classes of a suite across a pool of worker processes.
+
+	Each worker loads and runs a whole test class at a time, so class-level fixtures still run once
+	per class. Output is printed per class in discovery order, followed by one combined summary.
+	"""
+	class_names = []
+	local_suite = unittest.TestSuite()
+	for test in _iter_tests(suite):
+		test_class = type(test)
+		# Modules that failed to import are reported by placeholder tests that can't be loaded by name
+		if test_class.__module__ == unittest.loader.__name__:
+			local_suite.addTest(test)
+		else:
+			class_names.append(f"{test_class.__module__}.{test_class.__qualname__}")
+	class_names = list(dict.fromkeys(class_names))
+
+	start_time = time.perf_counter()
+	# No point starting more workers than there are classes to hand out
+	max_workers = max(1, min(workers or os.cpu_count() or 1, len(class_names)))
+	with ProcessPoolExecutor(max_workers=max_workers) as executor:
+		results = list(executor.map(_run_test_class, class_names, [verbosity] * len(class_names)))
+	if local_suite.countTestCases():
+		results.append(_run_captured(local_suite, verbosity))
+	elapsed = time.perf_counter() - start_time
+
+	return _print_parallel_summary(results, elapsed)
+
+
+def _print_parallel_summary(results, elapsed):
+	"""Print the captured output of each test class and a combined summary; return whether the run passed."""
+	totals = [0] * 6
+	for output, counts in results:
+		print(output, end="", file=sys.stderr)
+		totals = [total + count for total, count in zip(totals, counts)]
+	tests_run, failures, errors, skipped, expected_failures, unexpected_successes = totals
+
+	# Summary in the same format as unittest.TextTestRunner
+	print("-" * 70, file=sys.stderr)
+	print(f"Ran {tests_run} test{'' if tests_run == 1 else 's'} in {elapsed:.3f}s\n", file=sys.stderr)
+	infos = [
+		f"{label}={count}" for label, count in (
+			("failures", failures), ("errors", errors), ("skipped", skipped),
+			("expected failures", expected_failures), ("unexpected successes", unexpected_successes)
+		) if count
+	]
+	success = not (failures or errors or unexpected_successes)
+	status = "OK" if success else "FAILED"
+	print(f"{status} ({', '.join(infos)})" if infos else status, file=sys.stderr)
+
+	return success
+
+
 def run_specific_test_file(test_file, verbosity=2):
 	"""Run tests from a specific test file."""
-	test_path = Path(__file__).parent / test_file
+	test_path = _BASE_DIR / test_file
 
 	if not test_path.exists():
 		# Try with .py extension
@@ -82,14 +189,12 @@ def run_specific_test_file(test_file, verbosity=2):
 			return False
 
 	# Load and run the specific test module
-	loader = unittest.TestLoader()
-
 	# Convert path to module name
-	relative_path = test_path.relative_to(Path(__file__).parent)
+	relative_path = test_path.relative_to(_BASE_DIR)
 	module_name = str(relative_path.with_suffix('')).replace('/', '.').replace('\\', '.')
 
 	try:
-		suite = loader.loadTestsFromName(module_name)
+		suite = _LOADER.loadTestsFromName(module_name)
 		runner = unittest.TextTestRunner(verbosity=verbosity)
 		result = runner.run(suite)
 		return result.wasSuccessful()
@@ -99,41 +204,57 @@ def run_specific_test_file(test_file, verbosity=2):
 
 
 
+def _scan_tests(dir_path):
+	"""Return the sorted test_*.py file names in a directory."""
+	with os.scandir(dir_path) as entries:
+		return sorted(
+			entry.name for entry in entries
+			if entry.is_file() and entry.name.startswith("test_") and entry.name.endswith(".py")
+		)
+
+
 def list_available_tests():
 	"""List all available test modules and categories."""
 	print("Available Test Categories:\n")
 
-	base_dir = Path(__file__).parent
+	base_dir = _BASE_DIR
 
 	# List unit tests
 	unit_dir = base_dir / "unit"
 	if unit_dir.exists():
 		print("1. Unit Tests:")
-		for test_file in sorted(unit_dir.glob("test_*.py")):
-			print(f"   - {test_file.stem}")
+		for test_name in _scan_tests(unit_dir):
+			print(f"   - {Path(test_name).stem}")
 
 	# List integration tests
 	integration_dir = base_dir / "integration"
 	if integration_dir.exists():
 		print("\n2. Integration Tests:")
-		for test_file in sorted(integration_dir.glob("test_*.py")):
-			print(f"   - {test_file.stem}")
+		for test_name in _scan_tests(integration_dir):
+			print(f"   - {Path(test_name).stem}")
 
 	# List test case directories
 	print("\n3. Test Cases Directory Structure:")
 	cases_dir = base_dir / "cases"
 	if cases_dir.exists():
-		for case_dir in sorted(cases_dir.iterdir()):
-			if case_dir.is_dir():
-				view_files = list(case_dir.glob("**/view.json"))
-				print(f"   {case_dir.name}/")
-				for vf in view_files:
-					print(f"     - {vf.relative_to(cases_dir)}")
+		# Walk the cases tree once and group the view files by their top-level case directory
+		view_files_by_case = {}
+		for root, _, files in os.walk(cases_dir):
+			if "view.json" in files:
+				view_file = Path(root, "view.json").relative_to(cases_dir)
+				view_files_by_case.setdefault(view_file.parts[0], []).append(view_file)
+
+		with os.scandir(cases_dir) as entries:
+			case_names = sorted(entry.name for entry in entries if entry.is_dir())
+		for case_name in case_names:
+			print(f"   {case_name}/")
+			for vf in view_files_by_case.get(case_name, []):
+				print(f"     - {vf}")
 
 
 def setup_test_environment():
 	"""Set up the test environment by creating necessary directories and files."""
-	base_dir = Path(__file__).parent
+	base_dir = _BASE_DIR
 
 	# Create directories
 	dirs_to_create = [
@@ -169,28 +290,35 @@ def setup_test_environment():
 
 def run_test_by_name(test_name, verbosity=2):
 	"""Run a specific test by name (supports partial matching)."""
-	base_dir = Path(__file__).parent
-
-	# Search in unit tests
-	unit_dir = base_dir / "unit"
-	if unit_dir.exists():
-		for test_file in unit_dir.glob("test_*.py"):
-			if test_name.lower() in test_file.stem.lower():
-				print(f"Running unit test: {test_file.stem}")
-				return run_specific_test_file(f"unit/{test_file.name}", verbosity)
-
-	# Search in integration tests
-	integration_dir = base_dir / "integration"
-	if integration_dir.exists():
-		for test_file in integration_dir.glob("test_*.py"):
-			if test_name.lower() in test_file.stem.lower():
-				print(f"Running integration test: {test_file.stem}")
-				return run_specific_test_file(f"integration/{test_file.name}", verbosity)
+	search_name = test_name.lower()
+
+	# Search unit tests first, then integration tests
+	for category in ("unit", "integration"):
+		test_dir = _BASE_DIR / category
+		if not test_dir.exists():
+			continue
+		for file_name in _scan_tests(test_dir):
+			if search_name in file_name[:-3].lower():
+				print(f"Running {category} test: {file_name[:-3]}")
+				return run_specific_test_file(f"{category}/{file_name}", verbosity)
 
 	print(f"No test found matching: {test_name}")
 	return False
 
 
+def _worker_count(value):
+	"""Parse the --parallel worker count, where 'auto' means one worker per CPU."""
+	if value == "auto":
+		return 0
+	try:
+		workers = int(value)
+	except ValueError:
+		workers = -1
+	if workers < 0:
+		raise argparse.ArgumentTypeError(f"expected a non-negative integer or 'auto', got {value!r}")
+	return workers
+
+
 def main():
 	"""Main entry point for the modular test runner."""
 	parser = argparse.ArgumentParser(
@@ -204,6 +332,7 @@ def main():
 		python test_runner.py --setup                       # Set up test environment
 		python test_runner.py --test component_naming       # Run specific test by name
 		python test_runner.py --unit-pattern "test_component*" # Run unit tests matching pattern
+		python test_runner.py --run-all --parallel auto     # Run test classes in parallel (one worker per CPU)
 	"""
 	)
 
@@ -216,6 +345,10 @@ def main():
 	parser.add_argument("--test", help="Run a specific test by name (supports partial matching)")
 	parser.add_argument("--unit-pattern", help="Pattern for discovering unit tests (e.g., 'test_component*')")
 	parser.add_argument("--integration-pattern", help="Pattern for discovering integration tests")
+	parser.add_argument(
+		"--parallel", "--jobs", type=_worker_count, default=1, metavar="N",
+		help="Run test classes in N parallel worker processes (0 or 'auto' = one per CPU, default: 1 = serial)"
+	)
 
 	# Configuration and setup options
 	parser.add_argument("--setup", action="store_true", help="Set up the test environment")
@@ -260,13 +393,17 @@ def main():
 
 	success = True
 
-	# Run unit tests
-	if run_unit:
-		success = discover_and_run_unit_tests(args.unit_pattern, verbosity) and success
+	# Runs of both test types share a single discovery pass and test run
+	if run_unit and run_integration:
+		success = run_all_tests(args.unit_pattern, args.integration_pattern, verbosity, args.parallel)
+	else:
+		# Run unit tests
+		if run_unit:
+			success = discover_and_run_unit_tests(args.unit_pattern, verbosity, args.parallel) and success
 
-	# Run integration tests
-	if run_integration:
-		success = discover_and_run_integration_tests(args.integration_pattern, verbosity) and success
+		# Run integration tests
+		if run_integration:
+			success = discover_and_run_integration_tests(args.integration_pattern, verbosity, args.parallel) and success
 
 	# Final result
 	print("\n" + "=" * 60)
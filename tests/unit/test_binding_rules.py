@@ -7,22 +7,21 @@ Tests various binding validation rules.
 import unittest
 
 from fixtures.base_test import BaseRuleTest
-from fixtures.test_helpers import get_test_config, load_test_view
+from fixtures.test_helpers import get_test_config
 
 
 class TestBindingRules(BaseRuleTest):
 	"""Test binding-related validation rules."""
 
+	required_cases = ("ExpressionBindings", "PascalCase")
+
 	def test_binding_rule_base_functionality(self):
 		"""Test the base BindingRule functionality."""
 		# Test with PollingIntervalRule which extends BindingRule
 		rule_config = get_test_config("PollingIntervalRule", minimum_interval=5000)
 
-		view_file = load_test_view(self.test_cases_dir, "ExpressionBindings")
-		self.run_lint_on_file(view_file, rule_config)
-
-		# Verify the rule processes binding nodes
-		self.assertIsInstance(self.get_errors_for_rule("PollingIntervalRule"), list)
+		view_file = self.get_view("ExpressionBindings")
+		self.assert_lint_runs(view_file, rule_config)
 
 	def test_multiple_binding_types(self):
 		"""Test rules that target multiple binding types."""
@@ -33,13 +32,8 @@ class TestBindingRules(BaseRuleTest):
 
 		for case in test_cases:
 			with self.subTest(case=case):
-				try:
-					view_file = load_test_view(self.test_cases_dir, case)
-					self.run_lint_on_file(view_file, rule_config)
-					# Just verify it runs without error
-					self.assertIsInstance(self.get_errors_for_rule("PollingIntervalRule"), list)
-				except FileNotFoundError:
-					self.skipTest(f"Test case {case} not found")
+				view_file = self.get_view(case)
+				self.assert_lint_runs(view_file, rule_config)
 
 
 if __name__ == "__main__":
@@ -4,13 +4,14 @@ Unit tests for test discovery and framework functionality.
 Tests the test infrastructure itself.
 """
 
-import json
 import unittest
 
 from fixtures.base_test import BaseRuleTest
 from fixtures.test_helpers import (
 	create_mock_view,
+	create_mock_view_dict,
 	create_temp_view_file,
+	discover_test_cases,
 	get_test_config,
 	assert_no_errors,
 	assert_rule_errors,
@@ -23,14 +24,7 @@ class TestDiscoveryFunctionality(BaseRuleTest):
 
 	def test_discover_test_cases(self):
 		"""Test that test case discovery works correctly."""
-		discovered_cases = {}
-
-		if self.test_cases_dir.exists():
-			for case_dir in self.test_cases_dir.iterdir():
-				if case_dir.is_dir():
-					view_files = list(case_dir.glob("**/view.json"))
-					if view_files:
-						discovered_cases[case_dir.name] = view_files
+		discovered_cases = discover_test_cases(self.test_cases_dir)
 
 		# Should find some test cases
 		self.assertGreater(len(discovered_cases), 0, "Should discover some test cases")
@@ -61,31 +55,25 @@ class TestDiscoveryFunctionality(BaseRuleTest):
 			"type": "ia.display.label"
 		}]
 
-		view_content = create_mock_view(components)
+		view_data = create_mock_view_dict(components)
 
-		# Should be valid JSON
-		view_data = json.loads(view_content)
 		self.assertEqual(view_data["meta"]["name"], "root")
 		self.assertIn("props", view_data)
+		self.assertEqual(list(view_data["props"]["children"]), ["TestButton", "TestLabel"])
 
 	def test_temp_view_file_creation(self):
 		"""Test creating temporary view files."""
 		view_content = create_mock_view([{"name": "TempComponent"}])
 		temp_file = create_temp_view_file(view_content)
+		self.addCleanup(temp_file.unlink, missing_ok=True)
 
-		try:
-			self.assertTrue(temp_file.exists())
-			self.assertTrue(temp_file.name.endswith('.json'))
+		self.assertTrue(temp_file.exists())
+		self.assertTrue(temp_file.name.endswith('.json'))
 
-			# Should be able to read it back
-			with open(temp_file, 'r', encoding='utf-8') as f:
-				loaded_content = f.read()
+		# Should be able to read it back
+		loaded_content = temp_file.read_text(encoding='utf-8')
 
-			self.assertEqual(view_content, loaded_content)
-		finally:
-			# Clean up
-			if temp_file.exists():
-				temp_file.unlink()
+		self.assertEqual(view_content, loaded_content)
 
 	def test_helper_assertion_functions(self):
 		"""Test the helper assertion functions."""
@@ -5,11 +5,13 @@ This serves as both a test and a demonstration of how to test mixed-severity rul
 """
 
 from fixtures.base_test import BaseRuleTest
-from fixtures.test_helpers import get_test_config, create_mock_view, create_temp_view_file
+from fixtures.test_helpers import get_test_config, create_mock_view_dict
 
 class TestExampleMixedSeverityRule(BaseRuleTest):
 	"""Test the ExampleMixedSeverityRule to demonstrate mixed severity testing."""
 
+	rule_config = get_test_config("ExampleMixedSeverityRule")
+
 	def test_warnings_for_style_issues(self):
 		"""Test that style issues produce warnings."""
 		# Create a view with style issues
@@ -27,14 +29,11 @@ class TestExampleMixedSeverityRule(BaseRuleTest):
 				"type": "container"
 			}  # WARNING: no type suffix
 		]
-		mock_view_content = create_mock_view(components)
-		mock_view = create_temp_view_file(mock_view_content)
-
-		rule_config = get_test_config("ExampleMixedSeverityRule")
+		mock_view = create_mock_view_dict(components)
 
 		# Should have warnings but no errors
 		self.assert_rule_summary(
-			mock_view, rule_config, "ExampleMixedSeverityRule", expected_warnings=3, expected_errors=0
+			mock_view, self.rule_config, "ExampleMixedSeverityRule", expected_warnings=3, expected_errors=0
 		)
 
 	def test_errors_for_functional_issues(self):
@@ -50,14 +49,11 @@ class TestExampleMixedSeverityRule(BaseRuleTest):
 				"type": "panel"
 			}  # ERROR: conflicting indicators
 		]
-		mock_view_content = create_mock_view(components)
-		mock_view = create_temp_view_file(mock_view_content)
-
-		rule_config = get_test_config("ExampleMixedSeverityRule")
+		mock_view = create_mock_view_dict(components)
 
 		# Should have errors and may have warnings (components trigger suffix warning too)
 		self.assert_rule_summary(
-			mock_view, rule_config, "ExampleMixedSeverityRule", expected_warnings=1, expected_errors=2
+			mock_view, self.rule_config, "ExampleMixedSeverityRule", expected_warnings=1, expected_errors=2
 		)  # UnsafeComponent gets suffix warning
 
 	def test_mixed_warnings_and_errors(self):
@@ -81,15 +77,12 @@ class TestExampleMixedSeverityRule(BaseRuleTest):
 				"type": "container"
 			}  # ERROR: conflicting indicators
 		]
-		mock_view_content = create_mock_view(components)
-		mock_view = create_temp_view_file(mock_view_content)
-
-		rule_config = get_test_config("ExampleMixedSeverityRule")
+		mock_view = create_mock_view_dict(components)
 
 		# Should have both warnings and errors
 		# 4 warnings: tempButton (temp), TestLiveComponent (temp+suffix), x (short)
 		self.assert_rule_summary(
-			mock_view, rule_config, "ExampleMixedSeverityRule", expected_warnings=4, expected_errors=2
+			mock_view, self.rule_config, "ExampleMixedSeverityRule", expected_warnings=4, expected_errors=2
 		)
 
 	def test_clean_components_pass(self):
@@ -108,40 +101,31 @@ class TestExampleMixedSeverityRule(BaseRuleTest):
 			"name": "MainContainer",
 			"type": "container"
 		}]
-		mock_view_content = create_mock_view(components)
-		mock_view = create_temp_view_file(mock_view_content)
-
-		rule_config = get_test_config("ExampleMixedSeverityRule")
+		mock_view = create_mock_view_dict(components)
 
 		# Should pass completely
-		self.assert_rule_passes_completely(mock_view, rule_config, "ExampleMixedSeverityRule")
+		self.assert_rule_passes_completely(mock_view, self.rule_config, "ExampleMixedSeverityRule")
 
 	def test_warning_patterns(self):
 		"""Test that warnings contain expected patterns."""
 		components = [{"name": "tempLogin", "type": "container"}]
-		mock_view_content = create_mock_view(components)
-		mock_view = create_temp_view_file(mock_view_content)
-
-		rule_config = get_test_config("ExampleMixedSeverityRule")
+		mock_view = create_mock_view_dict(components)
 
 		# Check warning content
 		# 2 warnings: tempLogin (temp naming + missing suffix)
 		self.assert_rule_warnings(
-			mock_view, rule_config, "ExampleMixedSeverityRule", expected_warning_count=2,
+			mock_view, self.rule_config, "ExampleMixedSeverityRule", expected_warning_count=2,
 			warning_patterns=["temporary naming pattern", "consider renaming"]
 		)
 
 	def test_error_patterns(self):
 		"""Test that errors contain expected patterns."""
 		components = [{"name": "DebugComponent", "type": "container"}]
-		mock_view_content = create_mock_view(components)
-		mock_view = create_temp_view_file(mock_view_content)
-
-		rule_config = get_test_config("ExampleMixedSeverityRule")
+		mock_view = create_mock_view_dict(components)
 
 		# Check error content
 		self.assert_rule_errors(
-			mock_view, rule_config, "ExampleMixedSeverityRule", expected_error_count=1,
+			mock_view, self.rule_config, "ExampleMixedSeverityRule", expected_error_count=1,
 			error_patterns=["potentially unsafe", "debug functionality"]
 		)
 
@@ -162,10 +146,7 @@ class TestExampleMixedSeverityRule(BaseRuleTest):
 				"type": "button"
 			}  # Should not warn - common short name
 		]
-		mock_view_content = create_mock_view(components)
-		mock_view = create_temp_view_file(mock_view_content)
-
-		rule_config = get_test_config("ExampleMixedSeverityRule")
+		mock_view = create_mock_view_dict(components)
 
 		# Should pass completely
-		self.assert_rule_passes_completely(mock_view, rule_config, "ExampleMixedSeverityRule")
+		self.assert_rule_passes_completely(mock_view, self.rule_config, "ExampleMixedSeverityRule")
@@ -27,10 +27,14 @@ from ignition_lint.common.flatten_json import (
 class TestFlattenJson(unittest.TestCase):
 	"""Test the core flatten_json functionality."""
 
+	def assert_flattened_equal(self, result, expected):
+		"""Assert flattened output matches, including key order, which plain dict equality ignores."""
+		self.assertEqual(list(result.items()), list(expected.items()))
+
 	def test_flatten_empty_dict(self):
 		"""Test flattening an empty dictionary."""
 		result = flatten_json({})
-		self.assertEqual(result, OrderedDict())
+		self.assert_flattened_equal(result, OrderedDict())
 
 	def test_flatten_simple_dict(self):
 		"""Test flattening a simple dictionary with primitive values."""
@@ -39,7 +43,7 @@ class TestFlattenJson(unittest.TestCase):
 		result = flatten_json(data)
 		expected = OrderedDict([("name", "TestComponent"), ("visible", True), ("width", 100), ("height", 50)])
 
-		self.assertEqual(result, expected)
+		self.assert_flattened_equal(result, expected)
 
 	def test_flatten_nested_dict(self):
 		"""Test flattening nested dictionaries."""
@@ -61,7 +65,7 @@ class TestFlattenJson(unittest.TestCase):
 					("component.props.style.color", "blue"),
 					("component.props.style.fontSize", 14)])
 
-		self.assertEqual(result, expected)
+		self.assert_flattened_equal(result, expected)
 
 	def test_flatten_with_lists(self):
 		"""Test flattening structures with lists."""
@@ -71,7 +75,7 @@ class TestFlattenJson(unittest.TestCase):
 		expected = OrderedDict([("items[0]", "item1"), ("items[1]", "item2"), ("items[2]", "item3"),
 					("nested.numbers[0]", 1), ("nested.numbers[1]", 2), ("nested.numbers[2]", 3)])
 
-		self.assertEqual(result, expected)
+		self.assert_flattened_equal(result, expected)
 
 	def test_flatten_list_with_objects(self):
 		"""Test flattening lists containing objects."""
@@ -81,7 +85,7 @@ class TestFlattenJson(unittest.TestCase):
 		expected = OrderedDict([("children[0].name", "child1"), ("children[0].type", "Button"),
 					("children[1].name", "child2"), ("children[1].type", "Label")])
 
-		self.assertEqual(result, expected)
+		self.assert_flattened_equal(result, expected)
 
 	def test_flatten_with_component_name(self):
 		"""Test flattening with component names that affect path structure."""
@@ -91,7 +95,7 @@ class TestFlattenJson(unittest.TestCase):
 		expected = OrderedDict([("MyButton.meta.name", "MyButton"), ("MyButton.type", "ia.display.button"),
 					("MyButton.props.text", "Click me")])
 
-		self.assertEqual(result, expected)
+		self.assert_flattened_equal(result, expected)
 
 	def test_flatten_root_list(self):
 		"""Test flattening when the root element is a list."""
@@ -100,7 +104,7 @@ class TestFlattenJson(unittest.TestCase):
 		result = flatten_json(data)
 		expected = OrderedDict([("[0]", "item1"), ("[1]", "item2"), ("[2].nested", "value")])
 
-		self.assertEqual(result, expected)
+		self.assert_flattened_equal(result, expected)
 
 	def test_flatten_complex_ignition_structure(self):
 		"""Test flattening a structure similar to Ignition view components."""
@@ -148,7 +152,7 @@ class TestFlattenJson(unittest.TestCase):
 		# Empty lists should not appear in flattened results
 		expected = OrderedDict()
 
-		self.assertEqual(result, expected)
+		self.assert_flattened_equal(result, expected)
 
 	def test_flatten_mixed_types(self):
 		"""Test flattening with mixed primitive types."""
@@ -177,14 +181,16 @@ class TestFlattenJson(unittest.TestCase):
 class TestFileOperations(unittest.TestCase):
 	"""Test file I/O operations for JSON processing."""
 
-	def setUp(self): # pylint: disable=invalid-name
-		"""Set up temporary files for testing."""
-		self.temp_dir = Path(tempfile.mkdtemp())
+	@classmethod
+	def setUpClass(cls): # pylint: disable=invalid-name
+		"""Set up one temporary directory for the class; each test uses its own file name in it."""
+		cls.temp_dir = Path(tempfile.mkdtemp())
 
-	def tearDown(self): # pylint: disable=invalid-name
+	@classmethod
+	def tearDownClass(cls): # pylint: disable=invalid-name
 		"""Clean up temporary files."""
-		if self.temp_dir.exists():
-			shutil.rmtree(self.temp_dir)
+		if cls.temp_dir.exists():
+			shutil.rmtree(cls.temp_dir)
 
 	def test_read_json_file(self):
 		"""Test reading a JSON file."""
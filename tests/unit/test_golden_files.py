@@ -15,8 +15,9 @@ The test runs first (alphabetically) to catch model builder issues early.
 import json
 import sys
 import unittest
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
@@ -32,13 +33,12 @@ class TestGoldenFiles(unittest.TestCase):
 	@classmethod
 	def setUpClass(cls): # pylint: disable=invalid-name
 		"""Set up the test class."""
-		# Store rule classes for creating fresh engines
-		cls.rule_classes = []
+		# Store the default rules once for every engine; building the model and statistics only
+		# reads the rules' target node types, so engines can share them
+		cls.rules = []
 		for rule_name, rule_class in RULES_MAP.items():
 			try:
-				# Test that we can create the rule
-				rule_class.create_from_config({})
-				cls.rule_classes.append(rule_class)
+				cls.rules.append(rule_class.create_from_config({}))
 			except (TypeError, ValueError, AttributeError) as e:
 				print(f"Warning: Could not create rule {rule_name}: {e}")
 
@@ -51,6 +51,7 @@ class TestGoldenFiles(unittest.TestCase):
 
 		all_test_cases = []
 		cls.test_cases_with_golden_files = []
+		cls._fixture_cache = {}
 
 		for case_dir in cls.test_cases_dir.iterdir():
 			if case_dir.is_dir() and (case_dir / 'view.json').exists():
@@ -70,12 +71,21 @@ class TestGoldenFiles(unittest.TestCase):
 				"run `./scripts/generate_debug_files.py` to generate for all cases."
 			)
 
-	def _create_fresh_lint_engine(self) -> LintEngine:
-		"""Create a fresh LintEngine instance to avoid state accumulation."""
-		rules = []
-		for rule_class in self.rule_classes:
-			rules.append(rule_class.create_from_config({}))
-		return LintEngine(rules)
+	def _create_lint_engine(self) -> LintEngine:
+		"""Create a LintEngine over the shared rule instances, which reset their violations in each process_nodes."""
+		return LintEngine(list(self.rules))
+
+	def _get_fixtures(self, case_dir: Path) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+		"""Read, flatten and model a test case once, returning (flattened_json, model, stats)."""
+		if case_dir not in self._fixture_cache:
+			flattened_json = flatten_json(read_json_file(case_dir / 'view.json'))
+
+			# Statistics build the view model on the engine, which the serialized model then reuses
+			lint_engine = self._create_lint_engine()
+			stats = lint_engine.get_model_statistics(flattened_json)
+			model = lint_engine.serialize_view_model()
+			self._fixture_cache[case_dir] = (flattened_json, model, stats)
+		return self._fixture_cache[case_dir]
 
 	def test_00_golden_files_can_be_generated(self):
 		"""Test that we can generate golden files for key test cases."""
@@ -88,15 +98,7 @@ class TestGoldenFiles(unittest.TestCase):
 				self.fail(f"Test case directory missing: {case_dir}")
 
 			# Test that we can successfully process this case
-			view_file = case_dir / 'view.json'
-			json_data = read_json_file(view_file)
-			flattened_json = flatten_json(json_data)
-
-			lint_engine = self._create_fresh_lint_engine()
-			lint_engine.flattened_json = flattened_json
-			lint_engine.view_model = lint_engine.get_view_model()
-			model = lint_engine.serialize_view_model()
-			stats = lint_engine.get_model_statistics(flattened_json)
+			flattened_json, model, stats = self._get_fixtures(case_dir)
 
 			# Verify we got reasonable data
 			self.assertGreater(len(flattened_json), 0, f"No flattened data for {case_name}")
@@ -138,14 +140,11 @@ class TestGoldenFiles(unittest.TestCase):
 
 	def _assert_flattened_json_matches(self, case_dir: Path):
 		"""Assert that flattened JSON matches the golden file."""
-		view_file = case_dir / 'view.json'
 		# Updated path to tests/debug/cases/{case_name}/flattened.json
 		tests_dir = Path(__file__).parent.parent
 		golden_file = tests_dir / 'debug' / 'cases' / case_dir.name / 'flattened.json'
 
-		# Generate current flattened JSON
-		json_data = read_json_file(view_file)
-		current_flattened = flatten_json(json_data)
+		current_flattened = self._get_fixtures(case_dir)[0]
 
 		# Load golden file
 		try:
@@ -165,19 +164,11 @@ class TestGoldenFiles(unittest.TestCase):
 
 	def _assert_model_matches(self, case_dir: Path):
 		"""Assert that the model matches the golden file."""
-		view_file = case_dir / 'view.json'
 		# Updated path to tests/debug/cases/{case_name}/model.json
 		tests_dir = Path(__file__).parent.parent
 		golden_file = tests_dir / 'debug' / 'cases' / case_dir.name / 'model.json'
 
-		# Generate current model with fresh lint engine
-		json_data = read_json_file(view_file)
-		flattened_json = flatten_json(json_data)
-
-		lint_engine = self._create_fresh_lint_engine()
-		lint_engine.flattened_json = flattened_json
-		lint_engine.view_model = lint_engine.get_view_model()
-		current_model = lint_engine.serialize_view_model()
+		current_model = self._get_fixtures(case_dir)[1]
 
 		# Load golden file
 		try:
@@ -194,17 +185,11 @@ class TestGoldenFiles(unittest.TestCase):
 
 	def _assert_stats_match(self, case_dir: Path):
 		"""Assert that statistics match the golden file."""
-		view_file = case_dir / 'view.json'
 		# Updated path to tests/debug/cases/{case_name}/stats.json
 		tests_dir = Path(__file__).parent.parent
 		golden_file = tests_dir / 'debug' / 'cases' / case_dir.name / 'stats.json'
 
-		# Generate current stats with fresh lint engine
-		json_data = read_json_file(view_file)
-		flattened_json = flatten_json(json_data)
-
-		lint_engine = self._create_fresh_lint_engine()
-		current_stats = lint_engine.get_model_statistics(flattened_json)
+		current_stats = self._get_fixtures(case_dir)[2]
 
 		# Load golden file
 		try:
@@ -268,16 +253,18 @@ class TestGoldenFiles(unittest.TestCase):
 					f"Regenerate with: python scripts/generate_debug_files.py {case_name}"
 				)
 
-			# Compare node paths (order-independent)
+			# Compare node paths (order-independent, duplicates counted)
 			if current_nodes and expected_nodes:
-				current_paths = sorted([node.get('path', '') for node in current_nodes])
-				expected_paths = sorted([node.get('path', '') for node in expected_nodes])
+				current_paths = Counter(node.get('path', '') for node in current_nodes)
+				expected_paths = Counter(node.get('path', '') for node in expected_nodes)
 
 				if current_paths != expected_paths:
+					missing_paths = sorted((expected_paths - current_paths).elements())
+					extra_paths = sorted((current_paths - expected_paths).elements())
 					self.fail(
 						f"Model node paths mismatch for {case_name}.{key}. "
-						f"Current: {current_paths[:3]}{'...' if len(current_paths) > 3 else ''}, "
-						f"Expected: {expected_paths[:3]}{'...' if len(expected_paths) > 3 else ''}. "
+						f"Missing: {missing_paths[:3]}{'...' if len(missing_paths) > 3 else ''}, "
+						f"Extra: {extra_paths[:3]}{'...' if len(extra_paths) > 3 else ''}. "
 						f"Regenerate with: python scripts/generate_debug_files.py {case_name}"
 					)
 
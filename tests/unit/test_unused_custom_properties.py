@@ -15,9 +15,8 @@ REMAINING LIMITATIONS:
 - Does not detect when properties are used in scripts (scripts not processed by model builder)
 """
 
-import json
 from fixtures.base_test import BaseRuleTest
-from fixtures.test_helpers import get_test_config, create_temp_view_file
+from fixtures.test_helpers import get_test_config
 
 
 class TestUnusedCustomPropertiesRule(BaseRuleTest):
@@ -27,14 +26,11 @@ class TestUnusedCustomPropertiesRule(BaseRuleTest):
 		"""Test that unused view-level custom properties are detected."""
 		# Create a view with unused view-level custom property
 		view_data = {"custom": {"unusedViewProp": "value"}, "root": {"children": [], "meta": {"name": "root"}}}
-		mock_view_content = json.dumps(view_data, indent=2)
-		mock_view = create_temp_view_file(mock_view_content)
-
 		rule_config = get_test_config("UnusedCustomPropertiesRule")
 
 		# Should detect the unused view-level custom property
 		self.assert_rule_errors(
-			mock_view, rule_config, "UnusedCustomPropertiesRule", expected_error_count=1,
+			view_data, rule_config, "UnusedCustomPropertiesRule", expected_error_count=1,
 			error_patterns=["unusedViewProp", "never referenced"]
 		)
 
@@ -57,14 +53,11 @@ class TestUnusedCustomPropertiesRule(BaseRuleTest):
 				}
 			}
 		}
-		mock_view_content = json.dumps(view_data, indent=2)
-		mock_view = create_temp_view_file(mock_view_content)
-
 		rule_config = get_test_config("UnusedCustomPropertiesRule")
 
 		# Should detect the unused component custom property
 		self.assert_rule_errors(
-			mock_view, rule_config, "UnusedCustomPropertiesRule", expected_error_count=1,
+			view_data, rule_config, "UnusedCustomPropertiesRule", expected_error_count=1,
 			error_patterns=["unusedComponentProp", "never referenced"]
 		)
 
@@ -101,13 +94,10 @@ class TestUnusedCustomPropertiesRule(BaseRuleTest):
 				}
 			}
 		}
-		mock_view_content = json.dumps(view_data, indent=2)
-		mock_view = create_temp_view_file(mock_view_content)
-
 		rule_config = get_test_config("UnusedCustomPropertiesRule")
 
 		# Should not flag properties that are used in bindings
-		self.assert_rule_errors(mock_view, rule_config, "UnusedCustomPropertiesRule", expected_error_count=0)
+		self.assert_rule_errors(view_data, rule_config, "UnusedCustomPropertiesRule", expected_error_count=0)
 
 	def test_used_custom_property_in_script(self):
 		"""Test that custom properties referenced in scripts are not flagged."""
@@ -130,13 +120,10 @@ class TestUnusedCustomPropertiesRule(BaseRuleTest):
 				}]
 			}
 		}
-		mock_view_content = json.dumps(view_data, indent=2)
-		mock_view = create_temp_view_file(mock_view_content)
-
 		rule_config = get_test_config("UnusedCustomPropertiesRule")
 
 		# Should not flag properties that are used in scripts
-		self.assert_rule_errors(mock_view, rule_config, "UnusedCustomPropertiesRule", expected_error_count=0)
+		self.assert_rule_errors(view_data, rule_config, "UnusedCustomPropertiesRule", expected_error_count=0)
 
 	def test_mixed_used_and_unused_properties(self):
 		"""Test a view with both used and unused custom properties."""
@@ -173,14 +160,11 @@ class TestUnusedCustomPropertiesRule(BaseRuleTest):
 				}
 			}
 		}
-		mock_view_content = json.dumps(view_data, indent=2)
-		mock_view = create_temp_view_file(mock_view_content)
-
 		rule_config = get_test_config("UnusedCustomPropertiesRule")
 
 		# Should detect 2 unused properties
 		self.assert_rule_errors(
-			mock_view, rule_config, "UnusedCustomPropertiesRule", expected_error_count=2,
+			view_data, rule_config, "UnusedCustomPropertiesRule", expected_error_count=2,
 			error_patterns=["unusedProp", "unusedComponentProp"]
 		)
 
@@ -198,13 +182,24 @@ class TestUnusedCustomPropertiesRule(BaseRuleTest):
 				}
 			}
 		}
-		mock_view_content = json.dumps(view_data, indent=2)
-		mock_view = create_temp_view_file(mock_view_content)
-
 		rule_config = get_test_config("UnusedCustomPropertiesRule")
 
 		# Should detect the unused view parameter
 		self.assert_rule_errors(
-			mock_view, rule_config, "UnusedCustomPropertiesRule", expected_error_count=1,
+			view_data, rule_config, "UnusedCustomPropertiesRule", expected_error_count=1,
 			error_patterns=["unusedViewParam", "never referenced"]
 		)
+
+	def test_tracking_resets_between_views(self):
+		"""Test that a reused rule reports only the unused properties of the current view."""
+		rule_config = get_test_config("UnusedCustomPropertiesRule")
+		first_view = {"custom": {"firstViewProp": "value"}, "root": {"children": [], "meta": {"name": "root"}}}
+		second_view = {"custom": {"secondViewProp": "value"}, "root": {"children": [], "meta": {"name": "root"}}}
+
+		# Both passes share one engine, so the second sees the rule instance used by the first
+		self.run_lint_on_file(first_view, rule_config)
+		self.assert_rule_errors(
+			second_view, rule_config, "UnusedCustomPropertiesRule", expected_error_count=1,
+			error_patterns=["secondViewProp"]
+		)
+		self.assertNotIn("firstViewProp", " ".join(self.get_errors_for_rule("UnusedCustomPropertiesRule")))